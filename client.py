@@ -12,19 +12,21 @@ This module provides production-ready HTTP clients with:
 """
 
 import asyncio
+import functools
 import logging
 import random
 import time
-from typing import Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Union
 
 import httpx
-import pendulum
 
 logger = logging.getLogger(__name__)
 
 RETRIABLE_STATUS_CODES = {
-    104: "Connection Reset",
     408: "Request Timeout",
+    425: "Too Early",
     429: "Too Many Requests (rate limited)",
     500: "Internal Server Error",
     502: "Bad Gateway",
@@ -33,55 +35,154 @@ RETRIABLE_STATUS_CODES = {
 }
 
 HTTPX_EXCEPTIONS = {
-    httpx.TimeoutException: "Timeout",
-    httpx.NetworkError: "Network error",
-    httpx.ConnectError: "Connection error",
     httpx.ConnectTimeout: "Connection timeout",
     httpx.ReadTimeout: "Read timeout",
     httpx.PoolTimeout: "Pool timeout",
+    httpx.ConnectError: "Connection error",
+    httpx.TimeoutException: "Timeout",
+    httpx.NetworkError: "Network error",
     httpx.LocalProtocolError: "Local protocol error",
 }
 
+# Membership on the hot path tests against a frozenset (no value-slot load);
+# RETRIABLE_STATUS_CODES is only consulted for the description when logging
+_RETRIABLE_CODES = frozenset(RETRIABLE_STATUS_CODES)
+
+# Materialized once at import time so the except clauses don't rebuild a
+# tuple on every attempt. Ordered with specific subclasses before their
+# bases so type(e) lookups in HTTPX_EXCEPTIONS hit directly.
+_RETRIABLE_EXC_TUPLE = tuple(HTTPX_EXCEPTIONS)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_retry_after_cached(header: str) -> Optional[datetime]:
+    """Parse a stripped Retry-After date value into an absolute datetime.
+
+    Servers under sustained rate limiting tend to send the same Retry-After
+    value to many requests, so the expensive parse is memoized. The date is
+    cached as the parsed datetime (not the delta) so the remaining-seconds
+    calculation stays correct across cache hits.
+    """
+    try:
+        # RFC 7231 allows an IMF-fixdate (RFC 5322 date) as the alternative
+        # to delta-seconds; parsedate_to_datetime is the stdlib parser for it
+        return parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        logger.warning("Could not parse Retry-After header: %s", header)
+        return None
+
 
 def _parse_retry_after(retry_after_header: Optional[str]) -> Optional[float]:
     """Parse the Retry-After header value."""
     if not retry_after_header:
         return None
 
-    try:
-        seconds = int(retry_after_header.strip())
-        return float(seconds)
-    except ValueError:
-        try:
-            retry_date = pendulum.parse(retry_after_header.strip())
-            now = pendulum.now()
-            seconds = (retry_date - now).total_seconds()
-            # If date is in the past or invalid, fall back to None
-            if seconds <= 0:
-                return None
-            return seconds
-        except Exception:
-            logger.warning(f"Could not parse Retry-After header: {retry_after_header}")
-            return None
-
-
-def _calculate_backoff(attempt: int) -> float:
-    """Calculate exponential backoff delay with jitter."""
-    return random.uniform(0.8, 1.0) * (2**attempt)
-
-
-def _calculate_backoff_for_response(status_code: int, headers, attempt: int) -> float:
-    """Calculate backoff delay for a response with retry logic."""
-    # Respect Retry-After header for 429 (rate limiting) and 503 (service unavailable)
-    if status_code in (429, 503):
-        retry_after = _parse_retry_after(headers.get("Retry-After"))
-        if retry_after is not None:
-            return retry_after
-
-    return _calculate_backoff(attempt)
+    stripped = retry_after_header.strip()
+    # Delta-seconds is the dominant form servers send; isdecimal() keeps it
+    # exception-free (signed/invalid numbers fall through to the date path)
+    # and, unlike isdigit(), only accepts characters float() can convert
+    if stripped.isdecimal():
+        return float(stripped)
+
+    parsed = _parse_retry_after_cached(stripped)
+    if parsed is None:
+        return None
+
+    # parsedate_to_datetime returns a naive datetime for "-0000" offsets;
+    # treat those as UTC so the subtraction below stays valid
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    seconds = (parsed - datetime.now(timezone.utc)).total_seconds()
+    # If date is in the past or invalid, fall back to None
+    if seconds <= 0:
+        return None
+    return seconds
+
+
+# Bound once so the jitter computation skips a LOAD_ATTR per call
+_random = random.random
+
+# Cap on a single backoff delay; keeps worst-case latency bounded when
+# max_attempts is raised above the default
+_BACKOFF_CAP_S = 30.0
+
+
+def _calculate_backoff(attempt: int, cap: float = _BACKOFF_CAP_S) -> float:
+    """Calculate exponential backoff delay with full jitter, bounded by cap."""
+    # AWS-style full jitter: uniform(0, min(cap, 2**attempt)). Desynchronizes
+    # retries across clients better than proportional jitter and bounds the
+    # worst case. 1 << attempt is exact and cheaper than 2**attempt.
+    return min(cap, 1 << attempt) * _random()
+
+
+# Shared default configuration objects so clients built with default kwargs
+# don't allocate fresh Timeout/Limits instances on every construction
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=2.0)
+# keepalive_expiry defaults to 75s to match common server-side keep-alive
+# timeouts (e.g. nginx keepalive_timeout 75s) — a shorter client-side expiry
+# tears down connections the server would happily keep, forcing needless
+# TCP + TLS re-negotiation on the next request
+_DEFAULT_LIMITS = httpx.Limits(
+    max_keepalive_connections=50,
+    max_connections=50,
+    keepalive_expiry=75.0,
+)
+
+
+def _build_timeout(
+    connect_timeout: float,
+    read_timeout: float,
+    write_timeout: float,
+    pool_timeout: float,
+) -> httpx.Timeout:
+    """Build an httpx.Timeout, reusing the shared default when unchanged."""
+    if (connect_timeout, read_timeout, write_timeout, pool_timeout) == (
+        5.0,
+        10.0,
+        5.0,
+        2.0,
+    ):
+        return _DEFAULT_TIMEOUT
+    return httpx.Timeout(
+        connect=connect_timeout,  # Max seconds to wait while establishing the TCP connection
+        read=read_timeout,  # Max seconds to wait to receive data (response body reading)
+        write=write_timeout,  # Max seconds to wait to send data (request body sending)
+        pool=pool_timeout,  # Max seconds to wait when trying to acquire a connection from the pool
+    )
+
+
+def _build_limits(
+    max_connections: int,
+    max_keepalive_connections: Optional[int],
+    keepalive_expiry: float,
+) -> httpx.Limits:
+    """Build an httpx.Limits, reusing the shared default when unchanged."""
+    # Keep every pooled connection eligible for reuse unless told otherwise
+    if max_keepalive_connections is None:
+        max_keepalive_connections = max_connections
+    if (max_connections, max_keepalive_connections, keepalive_expiry) == (
+        50,
+        50,
+        75.0,
+    ):
+        return _DEFAULT_LIMITS
+    return httpx.Limits(
+        max_keepalive_connections=max_keepalive_connections,
+        max_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
 
 
 class ProductionHTTPClient:
+    # Applications commonly create one client per tenant/integration;
+    # __slots__ keeps those instances small and attribute access fast
+    __slots__ = ("base_url", "max_attempts", "backoff_cap", "client")
+
+    # Bound at class-body time so the except clause resolves a cached
+    # attribute instead of re-materializing the tuple per call
+    _RETRIABLE_EXCEPTIONS = _RETRIABLE_EXC_TUPLE
+    _EXCEPTION_DESCS = HTTPX_EXCEPTIONS
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -90,32 +191,37 @@ class ProductionHTTPClient:
         write_timeout: float = 5.0,
         pool_timeout: float = 2.0,
         max_connections: int = 50,
-        max_keepalive_connections: int = 20,
-        keepalive_expiry: float = 30.0,
+        max_keepalive_connections: Optional[int] = None,  # Defaults to max_connections
+        keepalive_expiry: float = 75.0,  # Match common server keep-alive (nginx: 75s)
         max_attempts: int = 5,  # Total number of attempts (initial + retries)
+        backoff_cap: float = _BACKOFF_CAP_S,  # Max seconds for a single backoff delay
         default_headers: Optional[dict] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,  # Disable for HTTP/2-hostile upstreams
     ):
         self.base_url = base_url
         self.max_attempts = max_attempts
+        self.backoff_cap = backoff_cap
+
+        # httpx only negotiates HTTP/2 over TLS (h2c is unsupported), so
+        # default to HTTP/1.1 for plaintext base URLs
+        if http2 is None:
+            http2 = base_url is None or base_url.startswith("https")
 
         # Configure timeout with individual timeout controls
-        httpx_timeout = httpx.Timeout(
-            connect=connect_timeout,  # Max seconds to wait while establishing the TCP connection
-            read=read_timeout,  # Max seconds to wait to receive data (response body reading)
-            write=write_timeout,  # Max seconds to wait to send data (request body sending)
-            pool=pool_timeout,  # Max seconds to wait when trying to acquire a connection from the pool
+        httpx_timeout = _build_timeout(
+            connect_timeout, read_timeout, write_timeout, pool_timeout
         )
 
         self.client = httpx.Client(
             base_url=base_url,
             timeout=httpx_timeout,
             headers=default_headers,
-            limits=httpx.Limits(
-                max_keepalive_connections=max_keepalive_connections,
-                max_connections=max_connections,
-                keepalive_expiry=keepalive_expiry,
+            limits=limits
+            or _build_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
             ),
-            http2=True,
+            http2=http2,
         )
 
     def close(self):
@@ -132,46 +238,80 @@ class ProductionHTTPClient:
 
     def request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
         """Make an HTTP request with automatic retry for transient errors."""
-        last_exception = None
-
-        for attempt in range(self.max_attempts):
+        # Hoist attribute lookups out of the retry loop (LOAD_FAST vs LOAD_ATTR)
+        do_request = self.client.request
+        sleep = time.sleep
+        warn = logger.warning
+        retriable_codes = _RETRIABLE_CODES
+        retriable_descs = RETRIABLE_STATUS_CODES
+        max_attempts = self.max_attempts
+        backoff_cap = self.backoff_cap
+
+        # All but the last attempt retry on failure; the final attempt is
+        # factored out below so the loop body has no "is this the last
+        # attempt?" branches
+        for attempt in range(max_attempts - 1):
             try:
-                response = self.client.request(method, url, **kwargs)
-
-                if response.status_code in RETRIABLE_STATUS_CODES:
-                    if attempt < self.max_attempts - 1:
-                        error_desc = RETRIABLE_STATUS_CODES[response.status_code]
-                        backoff = _calculate_backoff_for_response(
-                            response.status_code, response.headers, attempt
+                response = do_request(method, url, **kwargs)
+
+                status_code = response.status_code
+                if status_code in retriable_codes:
+                    # Only 429/503 carry a meaningful Retry-After; skip the
+                    # header lookup entirely for other retriable statuses
+                    if status_code in (429, 503):
+                        # httpx stores header names lowercased internally, so
+                        # the lowercase key skips its normalization step; the
+                        # None check skips the parse call when the header is
+                        # absent (common even for 429/503)
+                        retry_after_header = response.headers.get("retry-after")
+                        retry_after = (
+                            _parse_retry_after(retry_after_header)
+                            if retry_after_header is not None
+                            else None
                         )
-                        logger.warning(
-                            f"{error_desc} on {method} {url}, retrying in {backoff:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
+                        backoff = (
+                            retry_after
+                            if retry_after is not None
+                            else _calculate_backoff(attempt, backoff_cap)
                         )
-                        time.sleep(backoff)
-                        continue
                     else:
-                        response.raise_for_status()
+                        backoff = _calculate_backoff(attempt, backoff_cap)
+                    warn(
+                        "%s on %s %s, retrying in %.2fs (attempt %d/%d)",
+                        retriable_descs[status_code],
+                        method,
+                        url,
+                        backoff,
+                        attempt + 1,
+                        max_attempts,
+                    )
+                    sleep(backoff)
+                    continue
 
-                elif 400 <= response.status_code < 500:
+                if 400 <= status_code < 500:
                     response.raise_for_status()
 
                 return response
 
-            except tuple(HTTPX_EXCEPTIONS.keys()) as e:
-                last_exception = e
-                error_desc = HTTPX_EXCEPTIONS[type(e)]
-                if attempt < self.max_attempts - 1:
-                    backoff = _calculate_backoff(attempt)
-                    logger.warning(
-                        f"{error_desc} on {method} {url}, retrying in {backoff:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
-                    )
-                    time.sleep(backoff)
-                else:
-                    raise
-
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected error in request_with_retry")
+            except self._RETRIABLE_EXCEPTIONS as e:
+                error_desc = self._EXCEPTION_DESCS.get(type(e), "Transient error")
+                backoff = _calculate_backoff(attempt, backoff_cap)
+                warn(
+                    "%s on %s %s, retrying in %.2fs (attempt %d/%d)",
+                    error_desc,
+                    method,
+                    url,
+                    backoff,
+                    attempt + 1,
+                    max_attempts,
+                )
+                sleep(backoff)
+
+        # Final attempt — no sleep, failures raise
+        response = do_request(method, url, **kwargs)
+        if response.status_code in retriable_codes or 400 <= response.status_code < 500:
+            response.raise_for_status()
+        return response
 
     def get(self, url: str, **kwargs) -> httpx.Response:
         """GET request with retry logic."""
@@ -190,7 +330,27 @@ class ProductionHTTPClient:
         return self.request_with_retry("DELETE", url, **kwargs)
 
 
+# Process-wide registry of shared underlying AsyncClients, keyed by pool
+# configuration. Reference counted so a shared pool is only torn down when
+# the last wrapper using it closes.
+_CLIENT_REGISTRY: dict[tuple, httpx.AsyncClient] = {}
+_CLIENT_REFCOUNTS: dict[tuple, int] = {}
+
+# Sentinel _shared_key marking a shared wrapper that already released its
+# pool, so repeat close() calls don't decrement the refcount again
+_RELEASED = object()
+
+
 class AsyncProductionHTTPClient:
+    # Applications commonly create one client per tenant/integration;
+    # __slots__ keeps those instances small and attribute access fast
+    __slots__ = ("base_url", "max_attempts", "backoff_cap", "client", "_shared_key")
+
+    # Bound at class-body time so the except clause resolves a cached
+    # attribute instead of re-materializing the tuple per call
+    _RETRIABLE_EXCEPTIONS = _RETRIABLE_EXC_TUPLE
+    _EXCEPTION_DESCS = HTTPX_EXCEPTIONS
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -199,36 +359,110 @@ class AsyncProductionHTTPClient:
         write_timeout: float = 5.0,
         pool_timeout: float = 2.0,
         max_connections: int = 50,
-        max_keepalive_connections: int = 20,
-        keepalive_expiry: float = 30.0,
+        max_keepalive_connections: Optional[int] = None,  # Defaults to max_connections
+        keepalive_expiry: float = 75.0,  # Match common server keep-alive (nginx: 75s)
         max_attempts: int = 5,  # Total number of attempts (initial + retries)
+        backoff_cap: float = _BACKOFF_CAP_S,  # Max seconds for a single backoff delay
         default_headers: Optional[dict] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,  # Disable for HTTP/2-hostile upstreams
     ):
         self.base_url = base_url
         self.max_attempts = max_attempts
+        self.backoff_cap = backoff_cap
+        self._shared_key = None
+
+        # httpx only negotiates HTTP/2 over TLS (h2c is unsupported), so
+        # default to HTTP/1.1 for plaintext base URLs
+        if http2 is None:
+            http2 = base_url is None or base_url.startswith("https")
 
         # Configure timeout with individual timeout controls
-        httpx_timeout = httpx.Timeout(
-            connect=connect_timeout,  # Max seconds to wait while establishing the TCP connection
-            read=read_timeout,  # Max seconds to wait to receive data (response body reading)
-            write=write_timeout,  # Max seconds to wait to send data (request body sending)
-            pool=pool_timeout,  # Max seconds to wait when trying to acquire a connection from the pool
+        httpx_timeout = _build_timeout(
+            connect_timeout, read_timeout, write_timeout, pool_timeout
         )
 
         self.client = httpx.AsyncClient(
             base_url=base_url,
             timeout=httpx_timeout,
             headers=default_headers,
-            limits=httpx.Limits(
-                max_keepalive_connections=20,  # Keep connections alive
-                max_connections=50,  # Max total connections
-                keepalive_expiry=30.0,  # Keep connections for 30s
+            limits=limits
+            or _build_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
             ),
-            http2=True,  # Enable HTTP/2 for better connection reuse
+            http2=http2,  # HTTP/2 enables better connection reuse via multiplexing
         )
 
+    @classmethod
+    def shared(cls, **config) -> "AsyncProductionHTTPClient":
+        """Return a client whose connection pool is shared process-wide.
+
+        Independent call sites that request the same configuration get
+        wrappers around one underlying httpx.AsyncClient, collapsing N
+        separate pools into a single pool that HTTP/2 can multiplex over.
+        close() releases the shared pool only when the last wrapper using
+        it has closed.
+        """
+        headers = config.get("default_headers")
+        limits = config.get("limits")
+        key = (
+            config.get("base_url"),
+            config.get("connect_timeout", 5.0),
+            config.get("read_timeout", 10.0),
+            config.get("write_timeout", 5.0),
+            config.get("pool_timeout", 2.0),
+            config.get("max_connections", 50),
+            config.get("max_keepalive_connections"),
+            config.get("keepalive_expiry", 75.0),
+            tuple(sorted(headers.items())) if headers else None,
+            # httpx.Limits is unhashable, so key on its fields; equal Limits
+            # then share a pool regardless of object identity
+            (
+                limits.max_connections,
+                limits.max_keepalive_connections,
+                limits.keepalive_expiry,
+            )
+            if limits is not None
+            else None,
+            config.get("http2"),
+        )
+
+        shared_client = _CLIENT_REGISTRY.get(key)
+        if shared_client is None:
+            instance = cls(**config)
+            _CLIENT_REGISTRY[key] = instance.client
+            _CLIENT_REFCOUNTS[key] = 1
+        else:
+            # Build a wrapper around the cached client without constructing
+            # (and immediately discarding) a fresh pool
+            instance = cls.__new__(cls)
+            instance.base_url = config.get("base_url")
+            instance.max_attempts = config.get("max_attempts", 5)
+            instance.backoff_cap = config.get("backoff_cap", _BACKOFF_CAP_S)
+            instance.client = shared_client
+            _CLIENT_REFCOUNTS[key] += 1
+
+        instance._shared_key = key
+        return instance
+
     async def close(self):
-        """Clean up the client and close all connections."""
+        """Clean up the client and close all connections.
+
+        For clients created via shared(), the underlying pool is only
+        closed when the last wrapper sharing it releases.
+        """
+        key = self._shared_key
+        if key is _RELEASED:
+            # This wrapper already released its shared pool; closing again
+            # must not decrement the refcount out from under other wrappers
+            return
+        if key is not None:
+            self._shared_key = _RELEASED
+            _CLIENT_REFCOUNTS[key] -= 1
+            if _CLIENT_REFCOUNTS[key] > 0:
+                return
+            del _CLIENT_REGISTRY[key]
+            del _CLIENT_REFCOUNTS[key]
         await self.client.aclose()
 
     async def __aenter__(self):
@@ -243,51 +477,106 @@ class AsyncProductionHTTPClient:
         self, method: str, url: str, **kwargs
     ) -> httpx.Response:
         """Make an HTTP request with automatic retry for transient errors."""
-        last_exception = None
-
-        for attempt in range(self.max_attempts):
+        # Hoist attribute lookups out of the retry loop (LOAD_FAST vs LOAD_ATTR)
+        do_request = self.client.request
+        sleep = asyncio.sleep
+        warn = logger.warning
+        retriable_codes = _RETRIABLE_CODES
+        retriable_descs = RETRIABLE_STATUS_CODES
+        max_attempts = self.max_attempts
+        backoff_cap = self.backoff_cap
+
+        # All but the last attempt retry on failure; the final attempt is
+        # factored out below so the loop body has no "is this the last
+        # attempt?" branches
+        for attempt in range(max_attempts - 1):
             try:
-                response = await self.client.request(method, url, **kwargs)
-
-                if response.status_code in RETRIABLE_STATUS_CODES:
-                    if attempt < self.max_attempts - 1:
-                        error_desc = RETRIABLE_STATUS_CODES[response.status_code]
-                        backoff = _calculate_backoff_for_response(
-                            response.status_code, response.headers, attempt
+                response = await do_request(method, url, **kwargs)
+
+                status_code = response.status_code
+                if status_code in retriable_codes:
+                    # Only 429/503 carry a meaningful Retry-After; skip the
+                    # header lookup entirely for other retriable statuses
+                    if status_code in (429, 503):
+                        # httpx stores header names lowercased internally, so
+                        # the lowercase key skips its normalization step; the
+                        # None check skips the parse call when the header is
+                        # absent (common even for 429/503)
+                        retry_after_header = response.headers.get("retry-after")
+                        retry_after = (
+                            _parse_retry_after(retry_after_header)
+                            if retry_after_header is not None
+                            else None
                         )
-                        logger.warning(
-                            f"{error_desc} on {method} {url}, retrying in {backoff:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
+                        backoff = (
+                            retry_after
+                            if retry_after is not None
+                            else _calculate_backoff(attempt, backoff_cap)
                         )
-                        await asyncio.sleep(backoff)
-                        continue
                     else:
-                        response.raise_for_status()
+                        backoff = _calculate_backoff(attempt, backoff_cap)
+                    warn(
+                        "%s on %s %s, retrying in %.2fs (attempt %d/%d)",
+                        retriable_descs[status_code],
+                        method,
+                        url,
+                        backoff,
+                        attempt + 1,
+                        max_attempts,
+                    )
+                    await sleep(backoff)
+                    continue
 
-                elif 400 <= response.status_code < 500:
+                if 400 <= status_code < 500:
                     response.raise_for_status()
 
                 return response
 
-            except tuple(HTTPX_EXCEPTIONS.keys()) as e:
-                last_exception = e
-                error_desc = HTTPX_EXCEPTIONS[type(e)]
-                if attempt < self.max_attempts - 1:
-                    backoff = _calculate_backoff(attempt)
-                    logger.warning(
-                        f"{error_desc} on {method} {url}, retrying in {backoff:.2f}s (attempt {attempt + 1}/{self.max_attempts})"
-                    )
-                    await asyncio.sleep(backoff)
-                else:
-                    raise
-
-        if last_exception:
-            raise last_exception
-        raise RuntimeError("Unexpected error in request_with_retry")
+            except self._RETRIABLE_EXCEPTIONS as e:
+                error_desc = self._EXCEPTION_DESCS.get(type(e), "Transient error")
+                backoff = _calculate_backoff(attempt, backoff_cap)
+                warn(
+                    "%s on %s %s, retrying in %.2fs (attempt %d/%d)",
+                    error_desc,
+                    method,
+                    url,
+                    backoff,
+                    attempt + 1,
+                    max_attempts,
+                )
+                await sleep(backoff)
+
+        # Final attempt — no sleep, failures raise
+        response = await do_request(method, url, **kwargs)
+        if response.status_code in retriable_codes or 400 <= response.status_code < 500:
+            response.raise_for_status()
+        return response
 
     async def get(self, url: str, **kwargs) -> httpx.Response:
         """GET request with retry logic."""
         return await self.request_with_retry("GET", url, **kwargs)
 
+    async def get_many(
+        self, urls: list[str], *, max_concurrency: int = 20, **kwargs
+    ) -> list[Union[httpx.Response, BaseException]]:
+        """GET many URLs concurrently over the shared connection pool.
+
+        Issues the requests concurrently (bounded by max_concurrency so
+        in-flight requests stay within the pool's max_connections) so HTTP/2
+        can multiplex them over pooled connections. Results are returned in
+        input order; a request that exhausts its retries yields its exception
+        in place of a response instead of cancelling the rest of the batch.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded_get(url: str) -> httpx.Response:
+            async with semaphore:
+                return await self.request_with_retry("GET", url, **kwargs)
+
+        return await asyncio.gather(
+            *(_bounded_get(url) for url in urls), return_exceptions=True
+        )
+
     async def post(self, url: str, **kwargs) -> httpx.Response:
         """POST request without retry logic (POST is not idempotent)."""
         return await self.client.request("POST", url, **kwargs)